@@ -0,0 +1,17 @@
+"""Shared .env loading for the utility scripts.
+
+Reuses the parser in motherduck_benchmark.py so the scripts and the main CLI
+read .env files identically.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from motherduck_benchmark import ensure_environment  # noqa: E402
+
+
+def load_env(path=".env"):
+    """Copy .env values into os.environ without overriding variables already set."""
+    ensure_environment(Path(path))
@@ -3,21 +3,11 @@
 
 import duckdb
 import os
-from pathlib import Path
+
+from _env import load_env
 
 # Load token
-env_file = Path(".env")
-if env_file.exists():
-    for line in env_file.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" in line:
-            key, value = line.split("=", 1)
-            key = key.strip().replace("export ", "")
-            value = value.strip().strip('"').strip("'")
-            if key:
-                os.environ.setdefault(key, value)
+load_env()
 
 token = os.environ.get("MOTHERDUCK_TOKEN") or os.environ.get("motherduck_token")
 if token:
@@ -36,7 +26,7 @@ print("-" * 40)
 result = con.execute(f"EXPLAIN {test_query}")
 print("EXPLAIN columns:", result.description)
 print("EXPLAIN result:")
-for row in result.fetchall():
+for row in iter(result.fetchone, None):
     print(f"  Type: {type(row)}, Value: {row}")
 
 print("\n" + "-" * 40)
@@ -47,5 +37,5 @@ print("-" * 40)
 result = con.execute(f"EXPLAIN ANALYZE {test_query}")
 print("EXPLAIN ANALYZE columns:", result.description)
 print("EXPLAIN ANALYZE result:")
-for row in result.fetchall():
+for row in iter(result.fetchone, None):
     print(f"  Type: {type(row)}, Value: {row}")
\ No newline at end of file
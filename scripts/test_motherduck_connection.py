@@ -3,23 +3,13 @@
 
 import os
 import duckdb
-from pathlib import Path
+
+from _env import load_env
 
 
 def main():
     # Load token from environment or .env file
-    env_file = Path(".env")
-    if env_file.exists():
-        for line in env_file.read_text().splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip().replace("export ", "")
-                value = value.strip().strip('"').strip("'")
-                if key:
-                    os.environ.setdefault(key, value)
+    load_env()
 
     token = os.environ.get("MOTHERDUCK_TOKEN") or os.environ.get("motherduck_token")
     if not token: